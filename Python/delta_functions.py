@@ -15,18 +15,25 @@ def hash_rows(df, exclude_cols, hash_name):
     if hash_name not in col_names:
         df[hash_name] = np.nan
 
-    #The first element is the index, the second element of the iterrows tuple is the data
-    for i, r in df.iterrows():
-        row = r
-        row_str = ''
-        for c in col_names:
-            #Exclude rows we don't want in the hash
-            if c not in exclude_cols:
-                #Concatenate row value converted to a string and stripped
-                row_str = row_str + str(row[c]).strip()
-
-        #Digest the hash so values can be used in comparison
-        df.iloc[i, df.columns.get_loc(hash_name)] = hashlib.sha256(row_str.encode()).hexdigest()
+    #When every column is a numpy numeric, including the NaN filled row_hash column, iterating over the rows used to upcast
+    #every value to float64 (5 was hashed as 5.0). Keep doing that so digests already stored in the database still match.
+    #Nullable extension dtypes (Int64, Float64) were never upcast, so they are left as they come out of the column.
+    all_float = all(isinstance(dt, np.dtype) and dt.kind in 'iuf' for dt in df.dtypes)
+
+    #Build the row strings one column at a time. Iterating over a column gives python ints and floats for downcast
+    #numerics and the category values for categoricals, so frames from utils.compact_df give the same digests.
+    row_strs = [''] * len(df)
+    for c in col_names:
+        #Exclude rows we don't want in the hash
+        if c not in exclude_cols:
+            vals = df[c]
+            if all_float:
+                vals = (float(v) for v in vals)
+            #Concatenate row value converted to a string and stripped
+            row_strs = [s + str(v).strip() for s, v in zip(row_strs, vals)]
+
+    #Digest the hash so values can be used in comparison
+    df[hash_name] = [hashlib.sha256(s.encode()).hexdigest() for s in row_strs]
 
 def dml_verb(row, hash_name, suffix):
 
@@ -6,6 +6,7 @@ from pyproj import CRS
 
 from geopandas import GeoSeries, GeoDataFrame
 import re
+from . import utils
 
 #This function is a modification of geopandas.read_postgis() function
 def read_mssql(sql, #SQL Statement used to pull data
@@ -16,7 +17,8 @@ def read_mssql(sql, #SQL Statement used to pull data
                 print_sql = True, #Print the sql statement in case you want to debug it in SQL server
                 index_col=None,
                 coerce_float=True, 
-                params=None):
+                params=None,
+                compact = False): #Convert strings to categoricals/Arrow strings and downcast numerics to save memory
 
     """
     reads table, including geometry, from the parks MS SQL database and outputs to Geopandas GeoDataFrame
@@ -45,7 +47,8 @@ def read_mssql(sql, #SQL Statement used to pull data
 
     params : 
 
-
+    compact : Boolean,
+        Converts low-cardinality strings to categoricals, other strings to Arrow strings and downcasts numerics, if True
 
     Returns
     -------
@@ -119,8 +122,14 @@ def read_mssql(sql, #SQL Statement used to pull data
         print ('Note: No Coordinate Reference System (CRS) was specified! The CRS was set to ' + crs.values()[0] + 
               ', New York Long Island (ftUS).')
         
+    gdf = GeoDataFrame(df, crs=crs, geometry=geom_col)
+
+    #Convert the string and numeric columns to more memory efficient dtypes
+    if compact is True:
+        gdf = utils.compact_df(gdf)
+
     #Return the GeoDataFrame
-    return GeoDataFrame(df, crs=crs, geometry=geom_col)
+    return gdf
 
 
 
@@ -132,7 +141,8 @@ def read_geosql(sql, #SQL Statement used to pull data
                 crs=None, #The Projection to define for the geodataframe
                 index_col=None,
                 coerce_float=True, 
-                params=None):
+                params=None,
+                compact = False): #Convert strings to categoricals/Arrow strings and downcast numerics to save memory
     """
     reads county geometry from the parks MS SQL database
 
@@ -144,6 +154,8 @@ def read_geosql(sql, #SQL Statement used to pull data
         pyodbc database connection
     geom_raw : string, optional
         The raw (original geometry column)
+    compact : Boolean, optional
+        Converts low-cardinality strings to categoricals, other strings to Arrow strings and downcasts numerics, if True
     (rest of arguments)
 
     Returns
@@ -197,4 +209,10 @@ def read_geosql(sql, #SQL Statement used to pull data
         crs = CRS("EPSG:2263")
         # {'init' :'epsg:2263'}
 
-    return GeoDataFrame(df, crs=crs, geometry=geom_col)
\ No newline at end of file
+    gdf = GeoDataFrame(df, crs=crs, geometry=geom_col)
+
+    #Convert the string and numeric columns to more memory efficient dtypes
+    if compact is True:
+        gdf = utils.compact_df(gdf)
+
+    return gdf
\ No newline at end of file
@@ -4,6 +4,7 @@ from gspread import Client
 from gspread_dataframe import get_as_dataframe
 from gspread_dataframe import set_with_dataframe
 import re
+from . import utils
 
 def google_sheet_auth(cred_file):
 
@@ -43,7 +44,7 @@ def open_google_worksheet(cred_file, sheet_name, worksheet_name):
 
     return ws
 
-def read_google_sheet(cred_file, sheet_name, worksheet_name, evaluate_formulas = True, header = None, drop_empty_cols = True, **options):
+def read_google_sheet(cred_file, sheet_name, worksheet_name, evaluate_formulas = True, header = None, drop_empty_cols = True, compact = False, **options):
 
     #if not isinstance(evaluate_formulas, bool):
     #    raise TypeError('evaluate_formulas must be a boolean or True/False value')
@@ -70,6 +71,10 @@ def read_google_sheet(cred_file, sheet_name, worksheet_name, evaluate_formulas =
         if len(drop_cols) > 0:
             google_df.drop(columns = drop_cols, inplace = True)
 
+    #Convert the string and numeric columns to more memory efficient dtypes
+    if compact is True:
+        google_df = utils.compact_df(google_df)
+
     return google_df
 
 def write_google_sheet(dataframe, cred_file, sheet_name, worksheet_name, row = 1, col = 1, include_index = False,
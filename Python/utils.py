@@ -1,4 +1,6 @@
 import configparser
+import numpy as np
+import pandas as pd
 
 def get_config(cfile):
     # config = ConfigParser.ConfigParser()
@@ -11,3 +13,108 @@ def get_config(cfile):
         for option in config.options(section):
             config_dict[section][option] = config.get(section,option)
     return config_dict
+
+#Name of the DataFrame.attrs key that records the original dtypes of the columns converted by compact_df
+compact_key = 'compact_dtypes'
+
+#This function shrinks the memory footprint of a dataframe returned by the readers (read_mssql, read_geosql, read_google_sheet)
+def compact_df(df, cat_ratio = 0.5, print_report = True):
+
+    """
+    converts low-cardinality string columns to categoricals, other string columns to Arrow-backed strings and
+    downcasts numeric columns when the conversion is lossless
+
+    Parameters
+    ----------
+    df : DataFrame or GeoDataFrame,
+        The dataframe to compact, it is copied and left untouched
+    cat_ratio : float,
+        String columns whose share of distinct values is at or below this ratio become categoricals
+    print_report : Boolean,
+        Prints the memory used before and after compacting, if True
+
+    Returns
+    -------
+    DataFrame with the compacted columns. Every value keeps its string representation, so hash_rows gives the same
+    digests with or without compacting. String columns containing missing values (None or NaN) are left as they are
+    because categoricals and Arrow strings would change how the missing values are represented.
+
+    """
+
+    #Arrow-backed strings are only used if pyarrow is installed, otherwise high-cardinality strings are left alone
+    try:
+        arrow_str = pd.StringDtype('pyarrow')
+    except ImportError:
+        arrow_str = None
+
+    df = df.copy()
+    mem_before = df.memory_usage(deep = True).sum()
+    compacted = dict(df.attrs.get(compact_key, {}))
+
+    for c in df.columns:
+        s = df[c]
+        #Skip columns that were already compacted
+        if c in compacted:
+            continue
+
+        if pd.api.types.is_object_dtype(s.dtype) or isinstance(s.dtype, pd.StringDtype):
+            #Only convert columns holding nothing but strings, this leaves the WKB, geometry and partly missing columns untouched
+            if len(s) == 0 or s.isna().any() or not all(isinstance(v, str) for v in s):
+                continue
+
+            if s.nunique() <= cat_ratio * len(s):
+                new = s.astype('category')
+            elif arrow_str is not None and pd.api.types.is_object_dtype(s.dtype):
+                new = s.astype(arrow_str)
+            else:
+                continue
+
+        elif pd.api.types.is_integer_dtype(s.dtype) and not pd.api.types.is_extension_array_dtype(s.dtype):
+            new = pd.to_numeric(s, downcast = 'integer')
+            if new.dtype == s.dtype:
+                continue
+
+        elif s.dtype == np.float64:
+            #Only downcast to float32 if every value survives the round trip, NaNs are compared as equal
+            with np.errstate(over = 'ignore'):
+                new = s.astype(np.float32)
+            if not ((new.astype(np.float64) == s) | s.isna()).all():
+                continue
+
+        else:
+            continue
+
+        df[c] = new
+        compacted[c] = {'dtype': s.dtype, 'compact_dtype': new.dtype}
+
+    #The record is only used by restore_df. Merges and concats drop it and renames leave it pointing at the old names,
+    #hash_rows does not depend on it.
+    df.attrs[compact_key] = compacted
+
+    if print_report is True:
+        mem_after = df.memory_usage(deep = True).sum()
+        saved = mem_before - mem_after
+        pct = 100.0 * saved / mem_before if mem_before > 0 else 0.0
+        print('Note: Compacted ' + str(len(compacted)) + ' columns, memory went from ' + str(round(mem_before / 1024.0 ** 2, 2)) +
+              ' MB to ' + str(round(mem_after / 1024.0 ** 2, 2)) + ' MB, saving ' + str(round(saved / 1024.0 ** 2, 2)) +
+              ' MB (' + str(round(pct, 1)) + '%).')
+
+    return df
+
+#This function reverses compact_df, converting the compacted columns back to their original dtypes
+def restore_df(df):
+
+    compacted = df.attrs.get(compact_key, {})
+    if len(compacted) == 0:
+        return df
+
+    df = df.copy()
+    for c, dtypes in compacted.items():
+        #Columns that were dropped, renamed or replaced since compacting are left as they are
+        if c not in df.columns or df[c].dtype != dtypes['compact_dtype']:
+            continue
+        df[c] = df[c].astype(dtypes['dtype'])
+
+    df.attrs.pop(compact_key)
+
+    return df
@@ -0,0 +1,83 @@
+import hashlib
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('sqlalchemy')
+
+#The shared code is imported as a package named after its folder
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from Python import delta_functions, utils
+
+#The original row by row hash_rows, used to check that digests already stored in the database still match
+def legacy_hash_rows(df, exclude_cols, hash_name):
+    col_names = df.columns.values
+    exclude_cols.append(hash_name)
+    if hash_name not in col_names:
+        df[hash_name] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for i, r in df.iterrows():
+            row_str = ''
+            for c in col_names:
+                if c not in exclude_cols:
+                    row_str = row_str + str(r[c]).strip()
+            df.iloc[i, df.columns.get_loc(hash_name)] = hashlib.sha256(row_str.encode()).hexdigest()
+
+def hashes(df, hash_fn = delta_functions.hash_rows):
+    df = df.copy()
+    hash_fn(df, [], 'row_hash')
+    return list(df['row_hash'])
+
+@pytest.fixture
+def trees():
+    n = 200
+    return pd.DataFrame({'id': np.arange(n),
+                         'boro': (['BX', 'BK', None, 'MN'] * n)[:n],
+                         'species': (['oak', np.nan, 'elm', 'elm ', 'maple'] * n)[:n],
+                         'status': (['Alive', 'Dead'] * n)[:n],
+                         'name': ['tree ' + str(i) for i in range(n)],
+                         'dbh': np.arange(n) * 2.0 ** -20,
+                         'x': np.linspace(0.1, 1.1, n)})
+
+def test_compact_converts_columns(trees):
+    c = utils.compact_df(trees, print_report = False)
+    assert c['id'].dtype == np.int16
+    assert c['dbh'].dtype == np.float32
+    assert c['x'].dtype == np.float64
+    assert isinstance(c['status'].dtype, pd.CategoricalDtype)
+    #String columns with missing values keep their None and NaN
+    assert c['boro'].dtype == object and c['species'].dtype == object
+
+def test_hash_rows_same_digests(trees):
+    c = utils.compact_df(trees, print_report = False)
+    assert hashes(c) == hashes(trees) == hashes(trees, legacy_hash_rows)
+
+def test_hash_rows_same_digests_all_numeric():
+    df = pd.DataFrame({'id': np.arange(5), 'dbh': [2.0 ** -20, 1.5, np.nan, 3.0, 4.25]})
+    c = utils.compact_df(df, print_report = False)
+    assert hashes(c) == hashes(df) == hashes(df, legacy_hash_rows)
+
+@pytest.mark.parametrize('a', [[1, None, 3], [1, 2, 3]])
+def test_hash_rows_same_digests_nullable_numeric(a):
+    df = pd.DataFrame({'a': pd.array(a, dtype = 'Int64'), 'b': [1.0, 2.5, np.nan]})
+    c = utils.compact_df(df, print_report = False)
+    assert hashes(c) == hashes(df) == hashes(df, legacy_hash_rows)
+
+def test_hash_rows_after_merge_and_rename(trees):
+    c = utils.compact_df(trees, print_report = False)
+    lookup = pd.DataFrame({'id': np.arange(200), 'zone': (['A', 'B'] * 100)})
+    assert hashes(c.merge(lookup, on = 'id')) == hashes(trees.merge(lookup, on = 'id'))
+    assert hashes(c.rename(columns = {'status': 's'})) == hashes(trees.rename(columns = {'status': 's'}))
+
+def test_restore_df_skips_replaced_columns(trees):
+    c = utils.compact_df(trees, print_report = False)
+    c['status'] = c['status'].astype(str)
+    r = utils.restore_df(c)
+    assert r['status'].dtype == object
+    assert r['id'].dtype == np.int64 and r['dbh'].dtype == np.float64
+    assert r.equals(trees)